@@ -47,6 +47,7 @@ class ApiConfig {
   // Endpoints
   static String get newsEndpoint => '$baseUrl/news';
   static String get updateNewsEndpoint => '$baseUrl/news/update';
+  static String get updateStatusEndpoint => '$baseUrl/news/update/status';
   static String get apiUsageEndpoint => '$baseUrl/news/api-usage';
 }
 
@@ -143,8 +144,10 @@ class _NewsHomePageState extends State<NewsHomePage> {
           .post(Uri.parse(ApiConfig.updateNewsEndpoint))
           .timeout(const Duration(seconds: 10));
 
-      if (response.statusCode == 200) {
-        // Fetch the fresh articles
+      // The backend accepts the update and runs it in the background
+      if (response.statusCode == 200 || response.statusCode == 202) {
+        // Wait for the update to finish, then fetch the fresh articles
+        await _waitForUpdate();
         _fetchArticlesFromBackend();
       }
     } catch (e) {
@@ -152,6 +155,25 @@ class _NewsHomePageState extends State<NewsHomePage> {
     }
   }
 
+  // Poll the update status until the background update is no longer running
+  Future<void> _waitForUpdate() async {
+    const pollInterval = Duration(seconds: 2);
+    const maxPolls = 60;
+
+    for (var i = 0; i < maxPolls; i++) {
+      final response = await http
+          .get(Uri.parse(ApiConfig.updateStatusEndpoint))
+          .timeout(const Duration(seconds: 10));
+
+      if (response.statusCode != 200 ||
+          jsonDecode(response.body)['status'] != 'running') {
+        return;
+      }
+      await Future.delayed(pollInterval);
+    }
+    print('News update still running after ${maxPolls * 2} seconds');
+  }
+
   Future<void> _fetchArticlesFromBackend() async {
     // Avoid multiple simultaneous requests
     if (_isLoading) return;
@@ -1,12 +1,53 @@
-import json
+import atexit
+import os
+import tempfile
 import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
+import orjson
 
 # File to track API usage
 USAGE_TRACKER_FILE = 'api_usage.json'
 # MarketAux free tier limit
 DAILY_REQUEST_LIMIT = 100
+# Number of recorded requests to batch before writing usage data to disk
+FLUSH_EVERY = 10
+
+
+def _read_umask():
+    """Read the process umask (it can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Read once at import, while no other threads can create files
+_UMASK = _read_umask()
+
+
+def write_bytes_atomic(path, data):
+    """
+    Write data to path via a uniquely named temp file in the same directory,
+    then swap it in with os.replace, so readers never see a truncated file
+    and concurrent writers don't clobber each other's temp file.
+
+    Args:
+        path (Path): Destination file
+        data (bytes): File contents
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            # mkstemp creates the file owner-only; give it the umask
+            # default a plain open() would
+            os.fchmod(tmp.fileno(), 0o666 & ~_UMASK)
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 class APIUsageTracker:
@@ -14,13 +55,22 @@ class APIUsageTracker:
     Tracks and manages API usage to stay within free tier limits.
     MarketAux free tier: 100 requests/day, 3 articles/request
 
-    Thread-safe implementation for concurrent API calls.
+    Thread-safe implementation for concurrent API calls. Usage data is kept
+    in memory and written to disk every FLUSH_EVERY changes, on flush(),
+    and at interpreter exit. Counter updates only take a short-lived lock;
+    the main lock is held for the daily reset and disk writes.
     """
 
     def __init__(self, data_dir):
         self.tracker_path = Path(data_dir) / USAGE_TRACKER_FILE
-        self.lock = threading.Lock()  # Add thread safety
+        self.lock = threading.Lock()  # Guards the daily reset and disk writes
+        self._counter_lock = threading.Lock()  # Guards in-memory counters
         self.usage_data = self._load_usage_data()
+        self._dirty_count = 0  # Changes not yet written to disk
+        self._next_reset = None  # Cached midnight after the last reset
+        self._last_reset_date = None  # Parsed date of usage_data["last_reset"]
+        self._cache_last_reset()
+        atexit.register(self.flush)
 
     def _load_usage_data(self):
         """
@@ -31,9 +81,9 @@ class APIUsageTracker:
         """
         if self.tracker_path.exists():
             try:
-                with open(self.tracker_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                # One bulk read, parsed straight from bytes
+                return orjson.loads(self.tracker_path.read_bytes())
+            except (orjson.JSONDecodeError, IOError) as e:
                 # Log the error
                 print(f"Error loading API usage data: {e}")
 
@@ -45,37 +95,71 @@ class APIUsageTracker:
         }
 
     def _save_usage_data(self):
-        """Save the current usage data to file."""
+        """
+        Atomically save the current usage data to file.
+        Callers must hold self.lock.
+        """
+        # Snapshot the counters so the disk write happens outside the
+        # counter lock
+        with self._counter_lock:
+            # The tracker file is machine-read, so keep it compact
+            payload = orjson.dumps(self.usage_data)
+            pending = self._dirty_count
+            self._dirty_count = 0
+
         try:
             # Ensure the parent directory exists
             self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.tracker_path, 'w') as f:
-                json.dump(self.usage_data, f, indent=2)
+            write_bytes_atomic(self.tracker_path, payload)
         except IOError as e:
             print(f"Error saving API usage data: {e}")
+            # Keep the changes pending so a later flush retries them
+            with self._counter_lock:
+                self._dirty_count += pending
 
-    def _check_reset_day(self):
-        """Check if we need to reset the daily counter."""
+    def _cache_last_reset(self):
+        """Parse and cache the date of the last reset, resetting bad data."""
         try:
-            last_reset = datetime.fromisoformat(self.usage_data["last_reset"])
-            now = datetime.now()
-
-            # If it's a new day, reset the counter
-            if now.date() > last_reset.date():
-                self.usage_data["last_reset"] = now.isoformat()
-                self.usage_data["requests_today"] = 0
-                self._save_usage_data()
-        except (ValueError, KeyError) as e:
+            self._last_reset_date = datetime.fromisoformat(
+                self.usage_data["last_reset"]).date()
+        except (ValueError, KeyError, TypeError) as e:
             # Handle malformed date or missing keys
             print(f"Error checking reset day: {e}")
             # Reset the usage data to defaults
+            now = datetime.now()
             self.usage_data = {
-                "last_reset": datetime.now().isoformat(),
+                "last_reset": now.isoformat(),
                 "requests_today": 0,
                 "total_requests": 0
             }
-            self._save_usage_data()
+            self._last_reset_date = now.date()
+            self._dirty_count += 1
+            self._next_reset = None
+
+    def _check_reset_day(self, now=None):
+        """
+        Check if we need to reset the daily counter.
+
+        Args:
+            now (datetime, optional): Current time, if the caller already has it
+        """
+        if now is None:
+            now = datetime.now()
+
+        # Fast path: same day, no locking needed
+        if now.date() <= self._last_reset_date:
+            return
+
+        # If it's a new day, reset the counter. Re-check under the locks in
+        # case another thread already did.
+        with self.lock, self._counter_lock:
+            if now.date() > self._last_reset_date:
+                self.usage_data["last_reset"] = now.isoformat()
+                self.usage_data["requests_today"] = 0
+                self._last_reset_date = now.date()
+                self._dirty_count += 1
+                self._next_reset = None
 
     def can_make_request(self):
         """
@@ -84,20 +168,30 @@ class APIUsageTracker:
         Returns:
             bool: True if we can make a request, False otherwise
         """
-        with self.lock:
-            self._check_reset_day()
-            return self.usage_data["requests_today"] < DAILY_REQUEST_LIMIT
+        self._check_reset_day()
+        return self.usage_data["requests_today"] < DAILY_REQUEST_LIMIT
 
     def record_request(self):
         """
         Record that we made an API request.
-        Thread-safe implementation.
+        Thread-safe implementation. The change is written to disk once
+        FLUSH_EVERY changes have accumulated.
         """
-        with self.lock:
-            self._check_reset_day()
+        self._check_reset_day()
+        with self._counter_lock:
             self.usage_data["requests_today"] += 1
             self.usage_data["total_requests"] += 1
-            self._save_usage_data()
+            self._dirty_count += 1
+            should_flush = self._dirty_count >= FLUSH_EVERY
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Write any pending usage changes to disk."""
+        with self.lock:
+            if self._dirty_count:
+                self._save_usage_data()
 
     def get_remaining_requests(self):
         """
@@ -106,9 +200,8 @@ class APIUsageTracker:
         Returns:
             int: Number of remaining requests
         """
-        with self.lock:
-            self._check_reset_day()
-            return DAILY_REQUEST_LIMIT - self.usage_data["requests_today"]
+        self._check_reset_day()
+        return DAILY_REQUEST_LIMIT - self.usage_data["requests_today"]
 
     def get_usage_stats(self):
         """
@@ -117,17 +210,21 @@ class APIUsageTracker:
         Returns:
             dict: Dictionary with usage statistics
         """
-        with self.lock:
-            self._check_reset_day()
+        now = datetime.now()
+        self._check_reset_day(now)
 
-            # Calculate next reset time (midnight tonight)
-            now = datetime.now()
-            next_reset = datetime.combine(now.date() + timedelta(days=1),
-                                          datetime.min.time())
+        # Next reset time (midnight tonight) only changes when the daily
+        # counter resets, so compute it once per day
+        if self._next_reset is None:
+            self._next_reset = datetime.combine(
+                now.date() + timedelta(days=1), datetime.min.time())
+        next_reset = self._next_reset
 
-            # Calculate hours until reset
-            hours_until_reset = (next_reset - now).total_seconds() / 3600
+        # Calculate hours until reset
+        hours_until_reset = (next_reset - now).total_seconds() / 3600
 
+        # Read the counters together so the stats are consistent
+        with self._counter_lock:
             return {
                 "requests_today": self.usage_data["requests_today"],
                 "requests_remaining": DAILY_REQUEST_LIMIT - self.usage_data["requests_today"],
@@ -135,4 +232,39 @@ class APIUsageTracker:
                 "last_reset": self.usage_data["last_reset"],
                 "next_reset": next_reset.isoformat(),
                 "reset_in_hours": round(hours_until_reset, 1)
-            }
\ No newline at end of file
+            }
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for outgoing API requests.
+    Allows bursts of up to `capacity` requests, then throttles callers to
+    `rate` requests per second until the bucket refills.
+
+    Thread-safe implementation for concurrent API calls.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+
+    def acquire(self):
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            # Sleep outside the lock so other threads can check the bucket
+            time.sleep(wait)
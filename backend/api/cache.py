@@ -0,0 +1,18 @@
+from flask_caching import Cache
+
+# Cache key for the serialized /news response; one entry is kept per
+# version of the news file and content encoding
+NEWS_CACHE_KEY = 'news_v1'
+
+cache = Cache()
+
+def init_cache(app):
+    cache.init_app(app)
+
+def news_cache_key(version, encoding=None):
+    """
+    Cache key for the /news response for a news version in the given content
+    encoding. A new news file gets new keys, so responses cached for an older
+    file are never served again and just expire.
+    """
+    return f"{NEWS_CACHE_KEY}:{version}:{encoding or 'identity'}"
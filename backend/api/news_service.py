@@ -1,18 +1,34 @@
-import http.client
-import urllib.parse
-import json
+import gzip
+import logging
 import os
 import shutil
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+import orjson
+import requests
 from dotenv import load_dotenv
-from .api_manager import APIUsageTracker, DAILY_REQUEST_LIMIT
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .api_manager import (APIUsageTracker, RateLimiter, DAILY_REQUEST_LIMIT,
+                          write_bytes_atomic)
+
+# Brotli is optional; /news falls back to gzip without it
+BROTLI_AVAILABLE = False
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 API_TOKEN = os.getenv("API_TOKEN")
-print(f"API Token first 4 chars: {API_TOKEN[:4] if API_TOKEN else 'N/A'}")
+logger.debug("API Token first 4 chars: %s", API_TOKEN[:4] if API_TOKEN else 'N/A')
 
 # Define paths using Path for better cross-platform compatibility
 DATA_DIR = Path(os.getenv("NEWS_DATA_DIR",
@@ -27,11 +43,84 @@ ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
 CURRENT_NEWS_FILE = DATA_DIR / 'batmmaan_news.json'
 ARCHIVE_PATTERN = str(ARCHIVE_DIR / 'batmmaan_news_{date}.json')
 
+# The loaded version of CURRENT_NEWS_FILE: its modification time, parsed
+# articles and serialized response body (plain and compressed). Each version
+# is a separate dict swapped in with a single assignment; readers only touch
+# the dict they grabbed, so bytes never end up under another version.
+_news_cache = {'mtime': None, 'data': [], 'body': None, 'encoded': {}}
+
+# Content encodings the news body can be served in, most preferred first
+NEWS_ENCODINGS = ('br', 'gzip') if BROTLI_AVAILABLE else ('gzip',)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
 # Initialize API usage tracker
 api_tracker = APIUsageTracker(DATA_DIR)
 
+# Recently computed API usage stats, reused for USAGE_STATS_TTL seconds
+USAGE_STATS_TTL = 1.0
+_stats_cache = {'expires': 0.0, 'data': None}
+
 # BATMMAAN companies (Broadcom, Amazon, Tesla, Microsoft, Meta, Apple, Alphabet, Nvidia)
 BATMMAAN_SYMBOLS = "AVGO,AMZN,TSLA,MSFT,META,AAPL,GOOGL,GOOG,NVDA"
+# BATMMAAN company tickers fetched individually
+BATMMAAN_TICKERS = (
+    "AVGO",    # Broadcom
+    "AMZN",    # Amazon
+    "TSLA",    # Tesla
+    "MSFT",    # Microsoft
+    "META",    # Meta
+    "AAPL",    # Apple
+    "GOOGL",   # Alphabet (Class A)
+    "NVDA",    # Nvidia
+)
+
+# Defaults for article fields missing from the API response
+ARTICLE_DEFAULTS = {
+    "image_url": "",
+    "title": "No Title",
+    "description": "",
+    "source": "Unknown",
+    "published_at": "N/A",
+    "language": "N/A",
+    "url": "",
+}
+
+# MarketAux endpoint and HTTP settings
+MARKETAUX_NEWS_URL = 'https://api.marketaux.com/v1/news/all'
+REQUEST_TIMEOUT = 10  # seconds
+MAX_FETCH_WORKERS = 4  # Concurrent ticker requests
+REQUESTS_PER_SECOND = 1  # Sustained MarketAux request rate after a burst
+
+
+def _create_session():
+    """
+    Create the shared HTTP session for MarketAux requests.
+
+    The connection pool holds one keep-alive connection per fetch worker, so
+    concurrent ticker requests reuse TLS connections instead of opening new
+    ones. Only connection failures are retried: those never reach the API,
+    so they don't count against the daily request limit.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_FETCH_WORKERS,
+        max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.5),
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared session so ticker requests reuse pooled keep-alive connections
+_session = _create_session()
+
+# Lets a full ticker update burst through, then throttles repeated updates
+rate_limiter = RateLimiter(rate=REQUESTS_PER_SECOND,
+                           capacity=len(BATMMAAN_TICKERS))
 
 
 # API Client Functions
@@ -48,34 +137,34 @@ def fetch_marketaux_news(symbols=BATMMAAN_SYMBOLS, limit=3, language="en"):
     Returns:
         dict: API response with news data or error message
     """
-   # Check if we can make a request
-    usage_stats = api_tracker.get_usage_stats()
-    
+    # Check if we can make a request
     if not api_tracker.can_make_request():
-        reset_hours = usage_stats['reset_in_hours']
+        # Only build the full stats when we need them for the message
+        reset_hours = api_tracker.get_usage_stats()['reset_in_hours']
         remaining_msg = f"Daily API limit reached. Reset in {reset_hours} hours."
-        print(remaining_msg)
+        logger.warning(remaining_msg)
         return {"error": remaining_msg}
 
+    # Wait for a slot instead of sleeping a fixed time between requests
+    rate_limiter.acquire()
+
     try:
-        conn = http.client.HTTPSConnection('api.marketaux.com')
-        params = urllib.parse.urlencode({
+        params = {
             'api_token': API_TOKEN,
             'symbols': symbols,
             'limit': limit,
             'language': language,
-        })
+        }
 
-        conn.request('GET', f'/v1/news/all?{params}')
-        res = conn.getresponse()
-        status = res.status
-        
-        data = res.read()
+        res = _session.get(MARKETAUX_NEWS_URL, params=params,
+                           timeout=REQUEST_TIMEOUT)
         # Record the API request
         api_tracker.record_request()
-        
-        return json.loads(data.decode('utf-8'))
-    except json.JSONDecodeError:
+
+        # Parse the raw bytes directly with orjson, skipping the decode
+        # into an intermediate str
+        return orjson.loads(res.content)
+    except orjson.JSONDecodeError:
         return {"error": "Failed to parse MarketAux response"}
     except Exception as e:
         return {"error": f"API request failed: {str(e)}"}
@@ -91,46 +180,33 @@ def fetch_news_by_tickers(max_requests=8, language="en"):
     Returns:
     dict: News data
     """
-    # Separate BATMMAAN company tickers individually
-    batmmaan_tickers = [
-        "AVGO",    # Broadcom
-        "AMZN",    # Amazon
-        "TSLA",    # Tesla
-        "MSFT",    # Microsoft
-        "META",    # Meta
-        "AAPL",    # Apple
-        "GOOGL",   # Alphabet (Class A)
-        "NVDA"     # Nvidia
-    ]
-
-    all_articles = []
-    seen_ids = set()  # Set of IDs to prevent duplicates
-
     # Check the number of available API requests
     available_requests = min(api_tracker.get_remaining_requests(), max_requests)
 
     if available_requests <= 0:
         return {"error": "Daily API limit reached", "data": []}
 
-    # Make individual API requests for each ticker
-    for ticker in batmmaan_tickers[:available_requests]:
-        print(f"Fetching news for {ticker}...")
-        news_data = fetch_marketaux_news(symbols=ticker, limit=3, language=language)
-
-        if "data" in news_data and news_data["data"]:
-            # Add articles while removing duplicates
-            for article in news_data["data"]:
-                article_id = article.get("uuid", "")
-                if article_id and article_id not in seen_ids:
-                    seen_ids.add(article_id)
-                    all_articles.append(article)
-
-        # Small delay between requests to be nice to the API
-        if ticker != batmmaan_tickers[available_requests-1]:
-            time.sleep(1)
+    def fetch_ticker(ticker):
+        logger.info("Fetching news for %s...", ticker)
+        return fetch_marketaux_news(symbols=ticker, limit=3, language=language)
+
+    # Make individual API requests for each ticker concurrently;
+    # results come back in ticker order
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        results = list(executor.map(fetch_ticker,
+                                    BATMMAAN_TICKERS[:available_requests]))
+
+    # Merge the articles, removing duplicates by UUID. A dict keeps the
+    # position of each UUID's first occurrence.
+    unique_articles = {
+        article["uuid"]: article
+        for article in chain.from_iterable(
+            news_data.get("data") or [] for news_data in results)
+        if article.get("uuid")
+    }
 
     # Return in the same format
-    return {"data": all_articles}
+    return {"data": list(unique_articles.values())}
 
 # File Storage Functions
 def archive_current_news():
@@ -148,16 +224,41 @@ def archive_current_news():
     archive_path = ARCHIVE_PATTERN.format(date=timestamp)
 
     try:
-        # Copy current file to archive
-        shutil.copy2(CURRENT_NEWS_FILE, archive_path)
+        # Hardlink the current file into the archive. This is safe because
+        # save_news_to_json replaces the file rather than rewriting it in
+        # place, so the archived inode is never modified afterwards.
+        try:
+            os.link(CURRENT_NEWS_FILE, archive_path)
+        except OSError:
+            # Fall back to a copy across filesystems or where links
+            # are unsupported
+            shutil.copy2(CURRENT_NEWS_FILE, archive_path)
         return True
     except Exception as e:
-        print(f"Error archiving news file: {e}")
+        logger.error("Error archiving news file: %s", e)
         return False
 
 
 # Changes to news_service.py
 
+def _summary_repeats_title(summary, title):
+    """
+    Check whether a summary is the same as, or contained in, the title
+    (or vice versa).
+
+    Args:
+        summary (str): The generated summary
+        title (str): The article title
+
+    Returns:
+        bool: True if the summary adds nothing over the title
+    """
+    summary_lower = summary.lower()
+    title_lower = title.lower()
+    return (summary_lower == title_lower or summary_lower in title_lower
+            or title_lower in summary_lower)
+
+
 def format_articles(news_data):
     """
     Format raw API articles into a consistent structure,
@@ -173,70 +274,79 @@ def format_articles(news_data):
         return []
     
     # Import here to avoid circular imports
-    from .summarize_service import summarize_text, enhance_title
+    from .summarize_service import summarize_texts, enhance_titles
 
-    articles = []
-    for i, article in enumerate(news_data["data"], start=1):
-        # Extract company symbols from entities
-        symbols = []
-        company_name = None
-        if "entities" in article and article["entities"]:
-            for entity in article["entities"]:
-                if entity.get("symbol"):
-                    symbols.append(entity.get("symbol"))
-                    # Use the first symbol's name as company_name for context
-                    if not company_name and entity.get("name"):
-                        company_name = entity.get("name")
-
-        # Get full description for better summarization
-        description = article.get("description", "")
-        
-        # Enhance the title - make it more concise and impactful
-        original_title = article.get("title", "No Title")
-        enhanced_title = enhance_title(original_title)
-        
-        # If enhance_title returned None or empty string, use original title
-        if not enhanced_title:
-            enhanced_title = original_title
-            
-        # NEW: Don't include title in the full text to avoid redundancy
-        # This helps ensure the summary doesn't repeat the title
-        smart_summary = summarize_text(description, company_name, title_text=enhanced_title)
-        
-        # NEW: Additional check to ensure summary is not too similar to title
-        if smart_summary and enhanced_title:
-            # Simple check for high similarity
-            if smart_summary.lower() == enhanced_title.lower() or (
-                    len(smart_summary) > 0 and len(enhanced_title) > 0 and 
-                    (smart_summary.lower() in enhanced_title.lower() or 
-                     enhanced_title.lower() in smart_summary.lower())):
-                
-                # Try to extract a different summary by focusing on later parts of the text
-                sentences = description.split('.')
-                if len(sentences) > 3:
-                    # Use later sentences for the summary
-                    alternative_text = '. '.join(sentences[2:])
-                    smart_summary = summarize_text(alternative_text, company_name, title_text=enhanced_title)
-                    
-                    # If still too similar or empty, use a generic summary
-                    if not smart_summary or smart_summary.lower() == enhanced_title.lower():
-                        if company_name:
-                            smart_summary = f"Read more details about this {company_name} news story in the full article."
-                        else:
-                            smart_summary = "The article provides more details on this topic. Read the full text for comprehensive information."
+    raw_articles = news_data["data"]
+    # Fill in missing fields once per article instead of per-field .get()
+    filled_articles = [{**ARTICLE_DEFAULTS, **article} for article in raw_articles]
+
+    # Extract company symbols (and names) from entities
+    entity_pairs = [
+        [(entity.get("symbol"), entity.get("name"))
+         for entity in article.get("entities") or []]
+        for article in raw_articles
+    ]
+    # Use the first named symbol as company_name for context
+    company_names = [
+        next((name for symbol, name in pairs if symbol and name), None)
+        for pairs in entity_pairs
+    ]
+
+    # Get full descriptions for better summarization
+    descriptions = [article["description"] for article in filled_articles]
+    original_titles = [article["title"] for article in filled_articles]
+
+    # Enhance the titles in one batch - make them more concise and impactful.
+    # If enhance_title returned None or empty string, use original title
+    enhanced_titles = [
+        enhanced or original
+        for enhanced, original in zip(enhance_titles(original_titles), original_titles)
+    ]
+
+    # Summarize all descriptions in one batch. The title is passed separately
+    # (not included in the text) to avoid redundancy
+    summaries = summarize_texts(descriptions, company_names, enhanced_titles)
+
+    # Summaries that just repeat the title get one more batched pass over the
+    # later part of their description (skipping the first two sentences)
+    retry_texts = {}
+    for i, (summary, title, description) in enumerate(
+            zip(summaries, enhanced_titles, descriptions)):
+        if (summary and title and _summary_repeats_title(summary, title)
+                and description.count('.') > 2):
+            second_period = description.index('.', description.index('.') + 1)
+            retry_texts[i] = description[second_period + 1:]
+
+    if retry_texts:
+        retry_indices = list(retry_texts)
+        alternatives = summarize_texts(
+            [retry_texts[i] for i in retry_indices],
+            [company_names[i] for i in retry_indices],
+            [enhanced_titles[i] for i in retry_indices])
+
+        for i, alternative in zip(retry_indices, alternatives):
+            # If still too similar or empty, use a generic summary
+            if not alternative or alternative.lower() == enhanced_titles[i].lower():
+                if company_names[i]:
+                    alternative = f"Read more details about this {company_names[i]} news story in the full article."
+                else:
+                    alternative = "The article provides more details on this topic. Read the full text for comprehensive information."
+            summaries[i] = alternative
 
+    articles = []
+    for i, article in enumerate(filled_articles):
         articles.append({
-            "id": article.get("uuid", str(i)),
-            "image_url": article.get("image_url", ""),
-            "title": enhanced_title,
-            "original_title": original_title,  # Keep original title for reference
-            "description": description,
-            "snippet": smart_summary,
-            "source": article.get("source", "Unknown"),
-            "published_at": article.get("published_at", "N/A"),
-            "symbols": symbols,
-            "language": article.get("language", "N/A"),
-            "url": article.get("url", "")
+            "id": article.get("uuid", str(i + 1)),
+            "image_url": article["image_url"],
+            "title": enhanced_titles[i],
+            "original_title": original_titles[i],  # Keep original title for reference
+            "description": descriptions[i],
+            "snippet": summaries[i],
+            "source": article["source"],
+            "published_at": article["published_at"],
+            "symbols": [symbol for symbol, _ in entity_pairs[i] if symbol],
+            "language": article["language"],
+            "url": article["url"]
         })
 
     return articles
@@ -250,18 +360,21 @@ def save_news_to_json(news_data):
         news_data (dict): News data from API
 
     Returns:
-        int: Number of articles saved
+        list: The saved articles, or an empty list if nothing was saved
     """
     articles = format_articles(news_data)
 
     if not articles:
-        print(f"Error in news data: {news_data.get('error', 'No articles found')}")
-        return 0
+        logger.error("Error in news data: %s", news_data.get('error', 'No articles found'))
+        return []
 
     # Archive the current file first
     archive_result = archive_current_news()
     if not archive_result:
-        print("Note: No existing news file to archive")
+        logger.info("Note: No existing news file to archive")
+
+    # Persist any batched API usage changes alongside the news update
+    api_tracker.flush()
 
     # Create data object with articles and metadata
     data_to_save = {
@@ -273,31 +386,136 @@ def save_news_to_json(news_data):
     }
 
     try:
-        # Save to current news file
-        with open(CURRENT_NEWS_FILE, 'w') as json_file:
-            json.dump(data_to_save, json_file, indent=2)
-        return len(articles)
+        # Save to a temp file and atomically replace the current news file
+        payload = orjson.dumps(data_to_save, option=orjson.OPT_INDENT_2)
+        write_bytes_atomic(CURRENT_NEWS_FILE, payload)
+        # Write through to the read cache so the next read doesn't re-open
+        # and re-parse the file we just wrote
+        _set_news_version(CURRENT_NEWS_FILE.stat().st_mtime_ns, articles)
+        return articles
     except Exception as e:
-        print(f"Error saving news to JSON: {e}")
-        return 0
+        logger.error("Error saving news to JSON: %s", e)
+        return []
+
+
+def _set_news_version(mtime, articles):
+    """Swap in a new version of the news cache."""
+    global _news_cache
+    _news_cache = {'mtime': mtime, 'data': articles, 'body': None, 'encoded': {}}
+    return _news_cache
+
+
+def _current_news_version():
+    """
+    Get the cached version of the current JSON file, reloading it if the
+    file's modification time changed.
+
+    Returns:
+        dict: The news cache version, or None if the file is missing/invalid
+    """
+    version = _news_cache
+    try:
+        mtime = CURRENT_NEWS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if mtime == version['mtime']:
+        return version
+
+    try:
+        data = orjson.loads(CURRENT_NEWS_FILE.read_bytes())
+        return _set_news_version(mtime, data.get("articles", []))
+    except (orjson.JSONDecodeError, IOError) as e:
+        logger.error("Error reading news JSON: %s", e)
+        return None
+
+
+def _news_body(version):
+    """Serialize a version's articles once, reusing the bytes afterwards."""
+    if version is None or not version['data']:
+        return None
+    if version['body'] is None:
+        version['body'] = orjson.dumps(version['data'])
+    return version['body']
 
 
 def get_news_from_json():
     """
     Read news from the current JSON file.
+    The parsed articles are cached until the file's modification time changes.
 
     Returns:
         list: List of news articles or empty list if file not found/invalid
     """
-    try:
-        if CURRENT_NEWS_FILE.exists():
-            with open(CURRENT_NEWS_FILE, 'r') as json_file:
-                data = json.load(json_file)
-                return data.get("articles", [])
-        return []
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error reading news JSON: {e}")
-        return []
+    version = _current_news_version()
+    return version['data'] if version is not None else []
+
+
+def get_news_bytes():
+    """
+    Get the current news articles serialized as a JSON array.
+    The articles are serialized once per version of the news file, and the
+    bytes are reused until the file changes.
+
+    Returns:
+        bytes: JSON array of articles, or None if there are no articles
+    """
+    return _news_body(_current_news_version())
+
+
+def get_news_encoded(encoding):
+    """
+    Get the current news JSON compressed with a content encoding.
+    Like the plain body, each encoding is compressed once per version of the
+    news file.
+
+    Args:
+        encoding (str): 'gzip', or 'br' when brotli is installed
+
+    Returns:
+        bytes: Compressed JSON array, or None if there are no articles or
+            the encoding is not supported
+    """
+    if encoding not in NEWS_ENCODINGS:
+        return None
+
+    version = _current_news_version()
+    body = _news_body(version)
+    if body is None:
+        return None
+
+    encoded = version['encoded']
+    if encoding not in encoded:
+        if encoding == 'br':
+            encoded[encoding] = brotli.compress(body, quality=BROTLI_QUALITY)
+        else:
+            encoded[encoding] = gzip.compress(body, GZIP_LEVEL)
+    return encoded[encoding]
+
+
+def get_news_version():
+    """
+    Get an identifier for the current version of the news file, which changes
+    whenever the file is rewritten.
+
+    Returns:
+        int: The file's modification time in ns, or None if there is no news
+    """
+    version = _current_news_version()
+    return version['mtime'] if version is not None else None
+
+
+def get_news_last_modified():
+    """
+    Get when the currently loaded news file was last written.
+
+    Returns:
+        datetime: Modification time (UTC), or None if no news is loaded
+    """
+    mtime = _news_cache['mtime']
+    if mtime is None:
+        return None
+    return datetime.fromtimestamp(mtime / 1e9, tz=timezone.utc)
 
 
 # Public API Functions
@@ -311,21 +529,26 @@ def update_news(article_count=24, language="en"):
         language (str): Language filter (default: "en" for English only)
 
     Returns:
-        int: Number of articles actually saved
+        list: The articles actually saved (empty if the update failed)
     """
-    print(f"Starting news update: requested {article_count} articles, language={language}")
+    logger.info("Starting news update: requested %d articles, language=%s",
+                article_count, language)
     
     # Check API usage
     usage_stats = get_api_usage_stats()
-    print(f"Current API usage: {usage_stats['requests_today']}/{DAILY_REQUEST_LIMIT} requests used today")
+    logger.info("Current API usage: %d/%d requests used today",
+                usage_stats['requests_today'], DAILY_REQUEST_LIMIT)
     
     # Limit the number of requests to not exceed the number of BATMMAAN tickers
-    max_requests = min((article_count + 2) // 3, 8)  # 8 = number of BATMMAAN tickers
-    print(f"Will make up to {max_requests} API requests")
+    max_requests = min((article_count + 2) // 3, len(BATMMAAN_TICKERS))
+    logger.info("Will make up to %d API requests", max_requests)
 
     # Fetch news by ticker
     news_data = fetch_news_by_tickers(max_requests)
 
+    # The request counters changed, so drop the memoized stats
+    _stats_cache['data'] = None
+
     # Save to JSON file
     return save_news_to_json(news_data)
 
@@ -333,8 +556,13 @@ def update_news(article_count=24, language="en"):
 def get_api_usage_stats():
     """
     Get the current API usage statistics.
+    Results are memoized for USAGE_STATS_TTL seconds.
 
     Returns:
         dict: API usage statistics
     """
-    return api_tracker.get_usage_stats()
\ No newline at end of file
+    now = time.monotonic()
+    if _stats_cache['data'] is None or now >= _stats_cache['expires']:
+        _stats_cache['data'] = api_tracker.get_usage_stats()
+        _stats_cache['expires'] = now + USAGE_STATS_TTL
+    return _stats_cache['data']
\ No newline at end of file
@@ -1,48 +1,146 @@
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from flask import jsonify, current_app, request
-from .news_service import get_news_from_json, update_news, get_api_usage_stats
+from .news_service import (get_news_bytes, get_news_encoded, get_news_last_modified,
+                           get_news_version, update_news, get_api_usage_stats,
+                           NEWS_ENCODINGS)
+from .cache import cache, news_cache_key
 
 # Import the blueprint instance from the package
 from . import api_bp
 
+# Seconds clients may reuse a /news response without revalidating
+NEWS_MAX_AGE = 60
+
+# Articles fetched by a manual update when no valid count is given
+# (3 articles × 8 tickers), and the most a single update may request
+DEFAULT_ARTICLE_COUNT = 24
+MAX_ARTICLE_COUNT = 200
+
+# Body of the /news failure response, serialized once
+_EMPTY_JSON = b'[]'
+
+# Manual updates run off the request thread. A single worker keeps
+# updates from racing each other for the daily API quota.
+_update_executor = ThreadPoolExecutor(max_workers=1)
+_update_future = None
+_update_future_lock = threading.Lock()
+
+# Held while news is being fetched, so concurrent requests that find no
+# news wait for one update instead of each calling the API
+_update_lock = threading.Lock()
+
+def _is_refresh_request():
+    """Bypass the response cache when a refresh is requested."""
+    return request.args.get('refresh', 'false').lower() == 'true'
+
+def _article_count_arg():
+    """Read the count query parameter, clamped to 1..MAX_ARTICLE_COUNT."""
+    raw = request.args.get('count')
+    if raw is None or not raw.isdecimal():
+        return DEFAULT_ARTICLE_COUNT
+    return max(1, min(int(raw), MAX_ARTICLE_COUNT))
+
+def _preferred_encoding():
+    """Pick the best compressed encoding the client accepts, if any."""
+    accepted = request.accept_encodings
+    for encoding in NEWS_ENCODINGS:
+        if accepted[encoding]:
+            return encoding
+    return None
+
+def _news_response_key():
+    """Cache /news separately for each news version and content encoding."""
+    return news_cache_key(get_news_version(), _preferred_encoding())
+
+def _json_response(body):
+    """Build a response from serialized JSON, tagged with an ETag of the body."""
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    return response
+
+def _run_update(app, article_count):
+    """Update the news in the background."""
+    with app.app_context(), _update_lock:
+        return len(update_news(article_count))
+
+def _is_successful(rv):
+    """Only cache successful responses, never the empty 500 fallback."""
+    status = rv[1] if isinstance(rv, tuple) else getattr(rv, 'status_code', 200)
+    return status == 200
+
 @api_bp.route('/news', methods=['GET'])
+@cache.cached(key_prefix=_news_response_key, unless=_is_refresh_request,
+              response_filter=_is_successful)
 def get_news():
     """
     Returns news articles in JSON format for the Flutter frontend.
     Optionally refreshes data if requested or if data is stale.
+    Responses are cached until the next news update, and are sent
+    precompressed when the client accepts gzip or brotli.
     """
     # Check if we should force refresh
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
+    force_refresh = _is_refresh_request()
     
-    articles = get_news_from_json()
+    # Articles are serialized once per news update, not per request
+    body = get_news_bytes()
     
     # If articles are empty or force refresh is requested
-    if not articles or force_refresh:
-        current_app.logger.info("Fetching fresh articles from API...")
-        update_news()
-        articles = get_news_from_json()
+    if not body or force_refresh:
+        with _update_lock:
+            # Another request may have fetched the news while this one waited
+            body = None if force_refresh else get_news_bytes()
+            if not body:
+                current_app.logger.info("Fetching fresh articles from API...")
+                # update_news writes through to the news cache, so this doesn't
+                # re-read the file; if the update failed it serves the existing news
+                update_news()
+                body = get_news_bytes()
 
-    if articles:
-        return jsonify(articles)
+    if body:
+        # Compressed bodies are built once per news update, not per request
+        encoding = _preferred_encoding()
+        encoded = get_news_encoded(encoding) if encoding else None
+        response = _json_response(encoded or body)
+        if encoded:
+            response.content_encoding = encoding
+        response.vary.add('Accept-Encoding')
+        # Let clients revalidate with If-Modified-Since and reuse the
+        # response briefly without asking
+        response.last_modified = get_news_last_modified()
+        response.cache_control.max_age = NEWS_MAX_AGE
+        return response
     else:
-        return jsonify([]), 500
+        return current_app.response_class(_EMPTY_JSON, status=500,
+                                          mimetype='application/json')
 
 @api_bp.route('/news/update', methods=['POST'])
 def force_news_update():
     """
     Force an update of the news data.
     This endpoint can be used for manual updates if needed.
+    The update runs in the background; poll /news/update/status for the result.
     """
+    global _update_future
     try:
-        # Get optional count parameter with default of 24 (3 articles × 8 tickers)
-        article_count = request.args.get('count', 24, type=int)
-        articles_count = update_news(article_count)
+        # Get optional count parameter; missing or invalid values use the default
+        article_count = _article_count_arg()
+
+        with _update_future_lock:
+            if _update_future is not None and not _update_future.done():
+                return jsonify({
+                    "status": "running",
+                    "message": "An update is already in progress"
+                }), 202
+            _update_future = _update_executor.submit(
+                _run_update, current_app._get_current_object(), article_count)
 
-        api_stats = get_api_usage_stats()
         return jsonify({
-            "status": "success",
-            "message": f"Updated {articles_count} articles",
-            "api_usage": api_stats
-        })
+            "status": "accepted",
+            "message": f"Updating {article_count} articles"
+        }), 202
     except Exception as e:
         current_app.logger.error(f"Error in force update: {e}")
         return jsonify({
@@ -50,16 +148,50 @@ def force_news_update():
             "message": str(e)
         }), 500
 
+@api_bp.route('/news/update/status', methods=['GET'])
+def news_update_status():
+    """
+    Get the status of the most recent manual news update.
+    """
+    future = _update_future
+    if future is None:
+        return jsonify({"status": "idle"})
+    if not future.done():
+        return jsonify({"status": "running"})
+
+    error = future.exception()
+    if error is not None:
+        return jsonify({
+            "status": "error",
+            "message": str(error)
+        })
+    return jsonify({
+        "status": "success",
+        "message": f"Updated {future.result()} articles",
+        "api_usage": get_api_usage_stats()
+    })
+
 @api_bp.route('/news/api-usage', methods=['GET'])
 def api_usage():
     """
     Get the current API usage statistics.
     """
     try:
-        return jsonify(get_api_usage_stats())
+        return _json_response(orjson.dumps(get_api_usage_stats()))
     except Exception as e:
         current_app.logger.error(f"Error getting API usage: {e}")
         return jsonify({
             "status": "error",
             "message": str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+@api_bp.after_request
+def conditional_response(response):
+    """
+    Answer If-None-Match / If-Modified-Since requests with 304 Not Modified
+    when the response has not changed.
+    Runs after the response cache, so cached responses are checked too.
+    """
+    if response.get_etag()[0] or response.last_modified:
+        response.make_conditional(request)
+    return response
\ No newline at end of file
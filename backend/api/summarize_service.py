@@ -1,41 +1,130 @@
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
-from nltk.probability import FreqDist
-from collections import defaultdict
+from collections import Counter, OrderedDict
+import functools
+import hashlib
+import heapq
 import re
 import os
+import threading
 import torch
 from pathlib import Path
 
 # Updated NLTK data checking and downloading
 nltk_data_dir = Path(os.getenv("NLTK_DATA", Path.home() / 'nltk_data'))
 
+# NLTK resources used here, as (download name, data path)
+NLTK_RESOURCES = [
+    ('stopwords', 'corpora/stopwords'),
+]
+
+@functools.cache
 def ensure_nltk_resources():
-    """Ensure all required NLTK resources are available"""
-    try:
-        # Try to download the specific punkt_tab resource that's missing
-        nltk.download('punkt_tab')
-    except:
-        # If that fails, try the standard punkt resource
-        nltk.download('punkt')
-    
-    try:
-        nltk.download('stopwords')
-    except Exception as e:
-        print(f"Error downloading stopwords: {e}")
+    """
+    Ensure all required NLTK resources are available.
+    Only resources missing from disk are downloaded, and the check runs once
+    per process.
+    """
+    for resource, path in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            try:
+                nltk.download(resource, quiet=True, raise_on_error=True)
+            except Exception as e:
+                print(f"Error downloading {resource}: {e}")
 
-# Call this at module import time
-ensure_nltk_resources()
+# Word and sentence tokenizers, compiled once
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# Runs of whitespace
+_WS_RE = re.compile(r'\s+')
+# Numbers, percentages and amounts that mark data-rich sentences
+_NUM_RE = re.compile(r'\d+%|[$€£¥]\d+|\d+\.\d+')
 
 # Try to import transformers for advanced summarization
 TRANSFORMERS_AVAILABLE = False
 try:
-    from transformers import pipeline
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     pass
 
+# Try to import scikit-learn for TF-IDF sentence scoring
+SKLEARN_AVAILABLE = False
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    pass
+
+# Scale of TF-IDF salience relative to the position and length bonuses
+TFIDF_WEIGHT = 5
+
+# Summarization pipeline, loaded on first use and shared by all calls
+SUMMARIZER_MODEL = "facebook/bart-large-cnn"
+SUMMARIZER_BATCH_SIZE = 8
+# Shorter texts skip the model: with min_length=60 tokens it would mostly
+# echo them back, so the extractive summary is used instead
+MIN_TRANSFORMER_WORDS = 60
+# Opt-in int8 dynamic quantization for CPU-only deployments
+SUMMARIZER_INT8 = os.getenv("SUMMARIZER_INT8", "false").lower() == "true"
+_summarizer = None
+_summarizer_lock = threading.Lock()
+# One generation at a time: the pipeline isn't safe to share between
+# threads, and concurrent runs would only contend for the same device
+_inference_lock = threading.Lock()
+
+def _load_summarizer():
+    """
+    Build the summarization pipeline.
+    On GPU the model runs in half precision with BetterTransformer fused
+    kernels when optimum is installed; on CPU it can be quantized to int8.
+    """
+    use_cuda = torch.cuda.is_available()
+    tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_MODEL)
+    model = AutoModelForSeq2SeqLM.from_pretrained(
+        SUMMARIZER_MODEL, torch_dtype=torch.float16 if use_cuda else torch.float32)
+
+    if use_cuda:
+        model = model.to("cuda")
+        try:
+            model = model.to_bettertransformer()
+        except Exception as e:
+            print(f"BetterTransformer unavailable, using the default model: {e}")
+    elif SUMMARIZER_INT8:
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    return pipeline("summarization", model=model, tokenizer=tokenizer,
+                    device=0 if use_cuda else -1)
+
+def _get_summarizer():
+    """Load the summarization pipeline once and reuse it."""
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                _summarizer = _load_summarizer()
+    return _summarizer
+
+# Basic stopwords if NLTK stopwords unavailable
+FALLBACK_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as',
+    'what', 'when', 'where', 'how', 'who', 'which', 'this', 'that',
+    'to', 'in', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'of', 'for', 'with'})
+
+@functools.cache
+def get_stopwords():
+    """English stopwords, loaded once, with a fallback if NLTK's are unavailable."""
+    # Check for (and fetch) the NLTK data on first use, not at import
+    ensure_nltk_resources()
+    try:
+        return frozenset(stopwords.words('english'))
+    except Exception:
+        return FALLBACK_STOPWORDS
+
 def extract_keywords(text, num_keywords=8):
     """
     Extract key terms from the article to include in the summary.
@@ -48,40 +137,22 @@ def extract_keywords(text, num_keywords=8):
         list: List of keywords
     """
     try:
-        # Convert to lowercase and remove non-alphanumeric characters
-        text = re.sub(r'[^\w\s]', '', text.lower())
-        
-        # Try to tokenize words, with fallback
-        try:
-            words = word_tokenize(text)
-        except LookupError:
-            # Simple fallback tokenization if NLTK tokenizer fails
-            words = text.split()
+        # Tokenize lowercase words (punctuation is skipped by the tokenizer)
+        words = _WORD_RE.findall(text.lower())
         
-        # Remove stopwords, with fallback if stopwords not available
-        try:
-            stop_words = set(stopwords.words('english'))
-        except:
-            # Basic stopwords if NLTK stopwords unavailable
-            stop_words = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 
-                         'what', 'when', 'where', 'how', 'who', 'which', 'this', 'that', 
-                         'to', 'in', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 
-                         'have', 'has', 'had', 'do', 'does', 'did', 'of', 'for', 'with'}
-        
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
-        
-        # Calculate word frequencies
-        fdist = FreqDist(filtered_words)
+        # Count words, skipping stopwords and very short words
+        stop_words = get_stopwords()
+        counts = Counter(word for word in words if len(word) > 2 and word not in stop_words)
         
         # Get most common words
-        return [word for word, _ in fdist.most_common(num_keywords)]
+        return [word for word, _ in counts.most_common(num_keywords)]
     except Exception as e:
         print(f"Error extracting keywords: {e}")
         return ["news", "market", "company", "stock", "business"]  # Fallback keywords
 
 def simple_sentence_tokenize(text):
     """
-    Simple sentence tokenization as fallback if NLTK tokenizer fails.
+    Regex-based sentence tokenization.
     
     Args:
         text (str): Text to tokenize into sentences
@@ -89,69 +160,111 @@ def simple_sentence_tokenize(text):
     Returns:
         list: List of sentences
     """
-    # More sophisticated regex-based sentence splitting
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
+    sentences = (s.strip() for s in _SENT_RE.split(text))
     # Filter out empty or very short sentences
-    return [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
+    return [s for s in sentences if len(s) > 10]
+
+def tfidf_salience(sentences):
+    """
+    Score sentences by the sum of their TF-IDF term weights, treating the
+    article's sentences as the corpus.
+    
+    Args:
+        sentences (list): The article's sentences
+        
+    Returns:
+        list: A score per sentence, or None if scikit-learn is not available
+            or the sentences have no usable terms
+    """
+    if not SKLEARN_AVAILABLE or len(sentences) < 2:
+        return None
+    try:
+        vectorizer = TfidfVectorizer(stop_words='english', token_pattern=r'\b\w+\b')
+        matrix = vectorizer.fit_transform(sentences)
+    except ValueError:
+        # Only stopwords in the text
+        return None
+    return matrix.sum(axis=1).A1.tolist()
 
-def extract_important_sentences(text, keywords, max_sentences=4, title_text=""):
+def split_sentences(text):
     """
-    Extract the most important sentences based on keywords and position.
-    Also ensures minimal overlap with the title content.
+    Split article text into sentences, falling back to paragraphs and then
+    plain periods when the regex tokenizer finds too few.
+    
+    Args:
+        text (str): The article text
+        
+    Returns:
+        list: List of sentences
+    """
+    sentences = simple_sentence_tokenize(text)
+    
+    # If no sentences were extracted or too few, fall back to paragraph-based approach
+    if len(sentences) < 3 and len(text) > 200:
+        # Split by double newlines (paragraphs) and then by sentences
+        paragraphs = re.split(r'\n\s*\n', text)
+        sentences = []
+        for para in paragraphs:
+            sentences.extend(simple_sentence_tokenize(para))
+    
+    # If still no sentences and text exists, create basic sentences
+    if not sentences and text:
+        # Split by periods and ensure each "sentence" isn't too long
+        raw_sentences = text.split('.')
+        sentences = []
+        for s in raw_sentences:
+            if len(s.strip()) > 10:  # Only include if somewhat substantial
+                sentences.append(s.strip() + '.')
+    
+    return sentences
+
+def extract_important_sentences(text, keywords, max_sentences=4, title_text="", sentences=None):
+    """
+    Extract the most important sentences based on content and position.
+    Content is scored with TF-IDF when scikit-learn is available, and by
+    keyword presence otherwise. Also ensures minimal overlap with the
+    title content.
     
     Args:
         text (str): The article text
         keywords (list): List of keywords
         max_sentences (int): Maximum number of sentences to include
         title_text (str): The title text to avoid redundancy
+        sentences (list, optional): The text already split with split_sentences
         
     Returns:
         list: List of important sentences
     """
     try:
-        # Try NLTK's sentence tokenizer first
-        try:
-            sentences = sent_tokenize(text)
-        except LookupError:
-            # Fall back to simple tokenization if NLTK fails
-            sentences = simple_sentence_tokenize(text)
-        
-        # If no sentences were extracted or too few, fall back to paragraph-based approach
-        if len(sentences) < 3 and len(text) > 200:
-            # Split by double newlines (paragraphs) and then by sentences
-            paragraphs = re.split(r'\n\s*\n', text)
-            sentences = []
-            for para in paragraphs:
-                try:
-                    para_sentences = sent_tokenize(para)
-                except:
-                    para_sentences = simple_sentence_tokenize(para)
-                sentences.extend(para_sentences)
-        
-        # If still no sentences and text exists, create basic sentences
-        if not sentences and text:
-            # Split by periods and ensure each "sentence" isn't too long
-            raw_sentences = text.split('.')
-            sentences = []
-            for s in raw_sentences:
-                if len(s.strip()) > 10:  # Only include if somewhat substantial
-                    sentences.append(s.strip() + '.')
+        if sentences is None:
+            sentences = split_sentences(text)
         
         # Convert title to lowercase for comparison
         title_lower = title_text.lower()
-        title_words = set(re.findall(r'\b\w+\b', title_lower))
+        title_words = set(_WORD_RE.findall(title_lower))
+        
+        # Tokenize each sentence once, and when there is a title, work out
+        # once what share of its words each sentence repeats
+        sentence_tokens = [frozenset(_WORD_RE.findall(sentence.lower())) for sentence in sentences]
+        title_overlaps = None
+        if title_words:
+            title_overlaps = [len(tokens & title_words) / len(title_words)
+                              for tokens in sentence_tokens]
+        
+        # Content score for each sentence (None means use the keywords)
+        salience = tfidf_salience(sentences)
+        # Keyword weights, higher for more important keywords
+        keyword_weights = {keyword: len(keywords) - j for j, keyword in enumerate(keywords)}
         
         # Score sentences based on multiple factors
-        sentence_scores = defaultdict(int)
+        sentence_scores = [0] * len(sentences)
+        first_third = len(sentences) // 3
+        last_third = len(sentences) * 2 // 3
         
         for i, sentence in enumerate(sentences):
-            # Clean sentence (lowercase)
-            clean_sentence = sentence.lower()
-            sentence_words = set(re.findall(r'\b\w+\b', clean_sentence))
-            
             # Calculate overlap with title (penalize high overlap)
-            if title_words and len(title_words) > 0:
-                overlap_ratio = len(sentence_words.intersection(title_words)) / len(title_words)
+            if title_words:
+                overlap_ratio = title_overlaps[i]
                 # Penalize sentences that are too similar to the title
                 if overlap_ratio > 0.7:  # More than 70% overlap
                     sentence_scores[i] -= 5
@@ -160,20 +273,21 @@ def extract_important_sentences(text, keywords, max_sentences=4, title_text=""):
                 elif overlap_ratio < 0.2:  # Less than 20% overlap (good, provides new info)
                     sentence_scores[i] += 2
             
-            # Score based on keyword presence (weighted by keyword importance)
-            for j, keyword in enumerate(keywords):
-                keyword_weight = len(keywords) - j  # Higher weight for more important keywords
-                if keyword in clean_sentence:
-                    sentence_scores[i] += keyword_weight
+            if salience is not None:
+                sentence_scores[i] += salience[i] * TFIDF_WEIGHT
+            else:
+                # Score based on keyword presence (weighted by keyword importance)
+                sentence_scores[i] += sum(keyword_weights[word] for word in
+                                          keyword_weights.keys() & sentence_tokens[i])
             
             # Position-based scoring
             if i == 0:  # First sentence (most important)
                 sentence_scores[i] += 5
             elif i == 1:  # Second sentence
                 sentence_scores[i] += 3
-            elif i < len(sentences) // 3:  # First third of the article
+            elif i < first_third:  # First third of the article
                 sentence_scores[i] += 2
-            elif i > len(sentences) * 2 // 3:  # Last third of the article (conclusions)
+            elif i > last_third:  # Last third of the article (conclusions)
                 sentence_scores[i] += 1
                 
             # Length-based scoring (prefer medium-length sentences)
@@ -186,27 +300,22 @@ def extract_important_sentences(text, keywords, max_sentences=4, title_text=""):
                 sentence_scores[i] -= 1
                 
             # Contains numbers or specific data points
-            if re.search(r'\d+%|[$€£¥]\d+|\d+\.\d+', sentence):
+            if _NUM_RE.search(sentence):
                 sentence_scores[i] += 2
                 
         # Get top-scoring sentences while ensuring we don't exceed max_sentences
-        top_sentence_indices = sorted(
-            [i for i in sentence_scores], 
-            key=lambda idx: sentence_scores[idx], 
-            reverse=True
-        )[:max_sentences]
+        top_sentence_indices = heapq.nlargest(
+            max_sentences, range(len(sentences)), key=sentence_scores.__getitem__)
         
         # Always include the first sentence if it's not already included,
         # is not too short, and doesn't overlap too much with the title
         if 0 not in top_sentence_indices and len(sentences) > 0 and len(sentences[0].split()) >= 5:
             # Check title overlap for first sentence
-            first_sentence_words = set(re.findall(r'\b\w+\b', sentences[0].lower()))
             if title_words:
-                overlap = len(first_sentence_words.intersection(title_words)) / len(title_words)
-                if overlap < 0.6:  # Include only if overlap is less than 60%
+                if title_overlaps[0] < 0.6:  # Include only if overlap is less than 60%
                     if len(top_sentence_indices) >= max_sentences:
                         # Replace the lowest-scoring sentence
-                        min_score_idx = min(top_sentence_indices, key=lambda idx: sentence_scores[idx])
+                        min_score_idx = min(top_sentence_indices, key=sentence_scores.__getitem__)
                         top_sentence_indices.remove(min_score_idx)
                     top_sentence_indices.append(0)
         
@@ -252,7 +361,7 @@ def format_summary(sentences, company_name=None):
     raw_summary = ' '.join(sentences)
     
     # Clean up spacing issues
-    summary = re.sub(r'\s+', ' ', raw_summary).strip()
+    summary = _WS_RE.sub(' ', raw_summary).strip()
     
     # Ensure summary has proper capitalization
     if summary and summary[0].islower():
@@ -267,6 +376,56 @@ def format_summary(sentences, company_name=None):
     
     return summary
 
+def summarize_batch(texts, max_length=150, min_length=60):
+    """
+    Summarize several texts with batched passes through the transformer pipeline.
+    
+    Args:
+        texts (list): Texts to summarize
+        max_length (int): Maximum summary length in tokens
+        min_length (int): Minimum summary length in tokens
+        
+    Returns:
+        list: Raw summaries, in the same order as texts
+    """
+    summarizer = _get_summarizer()
+    # Inputs are truncated by the tokenizer to the model's limit (1024 tokens
+    # for BART), so long texts are cut on a token boundary, not mid-word
+    with _inference_lock:
+        results = summarizer(texts, max_length=max_length, min_length=min_length,
+                             do_sample=False, batch_size=SUMMARIZER_BATCH_SIZE,
+                             truncation=True)
+    return [result['summary_text'] for result in results]
+
+def _tidy_transformer_summary(summary):
+    """Clean up capitalization and final punctuation of a generated summary."""
+    summary = summary.strip()
+    
+    # Ensure proper capitalization
+    if summary and summary[0].islower():
+        summary = summary[0].upper() + summary[1:]
+        
+    # Ensure it ends with proper punctuation
+    if not summary.endswith(('.', '!', '?')):
+        summary = summary + '.'
+        
+    return summary
+
+def _transformer_summaries(texts):
+    """
+    Summarize cleaned texts with the transformer model in one batch.
+    
+    Returns:
+        list: A summary per text, or None for every text if generation fails
+    """
+    if not texts:
+        return []
+    try:
+        return [_tidy_transformer_summary(summary) for summary in summarize_batch(texts)]
+    except Exception as e:
+        print(f"Transformer summarization error: {e}")
+        return [None] * len(texts)
+
 def summarize_with_transformers(text, company_name=None, title_text=""):
     """
     Use Hugging Face transformers for summarization if available.
@@ -283,42 +442,85 @@ def summarize_with_transformers(text, company_name=None, title_text=""):
     if not TRANSFORMERS_AVAILABLE:
         return None
         
-    try:
-        # Check if CUDA is available for faster processing
-        device = 0 if torch.cuda.is_available() else -1
-        
-        # Create summarization pipeline
-        summarizer = pipeline("summarization", model="facebook/bart-large-cnn", device=device)
-        
-        # Process text (handle length limitations - max 1024 tokens for most models)
-        if len(text) > 5000:
-            text = text[:5000]  # Truncate to avoid issues
-            
-        # Generate summary
-        result = summarizer(text, max_length=150, min_length=60, do_sample=False)
-        
-        if result and len(result) > 0:
-            summary = result[0]['summary_text']
-            
-            # Clean up the transformer summary
-            summary = summary.strip()
-            
-            # Ensure proper capitalization
-            if summary and summary[0].islower():
-                summary = summary[0].upper() + summary[1:]
-                
-            # Ensure it ends with proper punctuation
-            if not summary.endswith(('.', '!', '?')):
-                summary = summary + '.'
-                
-            return summary
-    except Exception as e:
-        print(f"Transformer summarization error: {e}")
-    
-    return None
+    return _transformer_summaries([text])[0]
+
+# Recently generated summaries, keyed by a hash of the article text, company
+# and title, so stories seen again on the next poll aren't summarized again
+SUMMARY_CACHE_SIZE = 1024
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+def _summary_key(text, company_name, title_text):
+    """Hash the inputs that determine a summary."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (text or "", company_name or "", title_text or ""):
+        digest.update(part.encode())
+        digest.update(b'\0')
+    return digest.digest()
+
+def _cached_summary(key):
+    """Get a cached summary (marking it recently used), or None."""
+    with _summary_cache_lock:
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+        return summary
+
+def _store_summary(key, summary):
+    """Cache a summary, evicting the least recently used one when full."""
+    with _summary_cache_lock:
+        _summary_cache[key] = summary
+        _summary_cache.move_to_end(key)
+        if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
 
 # Changes to summarize_service.py
 
+# Common boilerplate phrases, removed more aggressively. Each pattern
+# stays within one sentence of at most 300 characters, so matching time is
+# linear in the text length even on adversarial input. Inner spans may
+# cross a dot that isn't followed by whitespace, so domain names such as
+# www.apple.com don't end the sentence.
+BOILERPLATE_PATTERNS = [
+    # Visit website phrases
+    r'(For more information|To learn more|For further details|Read more|Find out more|Click here for more)((?:[^.\n]|\.(?=\S)){1,300}?)(website|site|page|URL)[^.\n]{0,300}\.', 
+    r'Visit\s+(?:[^.\n]|\.(?=\S)){1,300}?\s+for\s+more\s+[^.\n]{0,300}\.', 
+    r'Click\s+here\s+to\s+[^.\n]{0,300}\.', 
+    r'Learn\s+more\s+at\s+[^.\n]{0,300}\.', 
+    
+    # Generic calls to action
+    r'Find\s+out\s+more\s+[^.\n]{0,300}\.', 
+    r'Learn\s+more\s+[^.\n]{0,300}\.', 
+    r'See\s+more\s+[^.\n]{0,300}\.', 
+    r'Read\s+the\s+full\s+[^.\n]{0,300}\.', 
+    r'Follow\s+this\s+link\s+[^.\n]{0,300}\.', 
+    
+    # Subscription prompts
+    r'Subscribe\s+to\s+our\s+newsletter[^.\n]{0,300}\.', 
+    r'Sign\s+up\s+for\s+our\s+[^.\n]{0,300}\.', 
+    r'Get\s+updates\s+[^.\n]{0,300}\.', 
+    
+    # Copyright notices
+    r'©\s*\d{4}[^.\n]{0,300}\.\s*', 
+    r'Copyright\s*©[^.\n]{0,300}\.\s*', 
+    
+    # Social media prompts
+    r'Follow\s+us\s+on\s+[^.\n]{0,300}\.', 
+    r'Like\s+us\s+on\s+[^.\n]{0,300}\.', 
+    r'Share\s+this\s+[^.\n]{0,300}\.', 
+    
+    # End-of-article indicators
+    r'The\s+content\s+is\s+provided\s+for\s+information\s+purposes\s+only[^.\n]{0,300}\.', 
+    r'All\s+rights\s+reserved[^.\n]{0,300}\.', 
+    r'This\s+article\s+was\s+originally\s+published\s+[^.\n]{0,300}\.', 
+]
+# All patterns merged into one regex so the text is scanned once. The
+# lookahead skips positions that cannot start any pattern: it lists the
+# first letter of each pattern above, and must be kept in sync with them.
+_BOILERPLATE_RE = re.compile(
+    r'(?=[ftrcvlsga©])(?:' + '|'.join(f'(?:{p})' for p in BOILERPLATE_PATTERNS) + ')',
+    re.IGNORECASE)
+
 # 1. Improve clean_article_text function to remove more boilerplate
 def clean_article_text(text):
     """
@@ -333,50 +535,51 @@ def clean_article_text(text):
     if not text:
         return ""
     
-    # More aggressive removal of common boilerplate phrases
-    boilerplate_patterns = [
-        # Visit website phrases
-        r'(For more information|To learn more|For further details|Read more|Find out more|Click here for more)(.+?)(website|site|page|URL).*?\.', 
-        r'Visit\s+.+?\s+for\s+more\s+.*?\.', 
-        r'Click\s+here\s+to\s+.*?\.', 
-        r'Learn\s+more\s+at\s+.*?\.', 
-        
-        # Generic calls to action
-        r'Find\s+out\s+more\s+.*?\.', 
-        r'Learn\s+more\s+.*?\.', 
-        r'See\s+more\s+.*?\.', 
-        r'Read\s+the\s+full\s+.*?\.', 
-        r'Follow\s+this\s+link\s+.*?\.', 
-        
-        # Subscription prompts
-        r'Subscribe\s+to\s+our\s+newsletter.*?\.', 
-        r'Sign\s+up\s+for\s+our\s+.*?\.', 
-        r'Get\s+updates\s+.*?\.', 
-        
-        # Copyright notices
-        r'©\s*\d{4}.*?\.\s*', 
-        r'Copyright\s*©.*?\.\s*', 
-        
-        # Social media prompts
-        r'Follow\s+us\s+on\s+.*?\.', 
-        r'Like\s+us\s+on\s+.*?\.', 
-        r'Share\s+this\s+.*?\.', 
-        
-        # End-of-article indicators
-        r'The\s+content\s+is\s+provided\s+for\s+information\s+purposes\s+only.*?\.', 
-        r'All\s+rights\s+reserved.*?\.', 
-        r'This\s+article\s+was\s+originally\s+published\s+.*?\.', 
-    ]
-    
-    # Apply all patterns
-    for pattern in boilerplate_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    # Apply all patterns in one pass
+    text = _BOILERPLATE_RE.sub('', text)
     
     # Clean up multiple spaces and line breaks
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     
     return text
 
+# Title cleanup patterns for enhance_title, compiled once
+# Stock ticker patterns: (NASDAQ:NVDA), (NYSE:AAPL), etc.
+_TICKER_RE = re.compile(r'\s*\([A-Z]+:[A-Z]+\)')
+REDUNDANT_PREFIXES = [
+    "BREAKING: ", "Breaking: ", "UPDATE: ", "Update: ", "EXCLUSIVE: ", "Exclusive: ",
+    "REPORT: ", "Report: ", "WATCH: ", "Watch: ", "JUST IN: ", "Just In: ",
+    "VIDEO: ", "Video: ", "ANALYSIS: ", "Analysis: ", "FEATURED: ", "Featured: ",
+    "ALERT: ", "Alert: ", "TRENDING: ", "Trending: "
+]
+_PREFIX_RE = re.compile('^(?:' + '|'.join(map(re.escape, REDUNDANT_PREFIXES)) + ')')
+_TRAILING_DOTS_RE = re.compile(r'\.{3,}$')
+_TRAILING_ELLIPSIS_RE = re.compile(r'\s*\.\.\.$')
+# Phrases that add little value, removed in list order (earlier phrases
+# win where two overlap)
+FILLER_PHRASES = [
+    " according to sources", " according to reports", " according to insiders",
+    " sources say", " reports indicate", " experts say", " analysts believe",
+    ", experts say", ", analysts say", ", sources say", ", reports indicate",
+    " - report", " - sources", " - analysts", " - insiders", " report claims",
+    " analysts report", " sources claim", ", report says", ", report claims"
+]
+# Common company names that might appear redundantly, as (lowercase name,
+# pattern for the name followed by 1-3 words at the end, pattern for the
+# trailing mention to remove)
+COMMON_COMPANIES = ["Amazon", "Amazon.com", "Apple", "Microsoft", "Google", "Meta",
+                    "Facebook", "Tesla", "Nvidia", "Broadcom", "Alphabet"]
+_COMPANY_RES = [
+    (company.lower(),
+     re.compile(rf'{re.escape(company.lower())}(\s+\w+){{1,3}}$'),
+     re.compile(rf'(,?\s+|-\s+)({re.escape(company.lower())}(\s+\w+){{0,3}})$'))
+    for company in COMMON_COMPANIES
+]
+_DANGLING_END_RE = re.compile(r'[,\s-]+\.$')
+# Natural break points for shortening long titles
+_BREAK_RES = [re.compile(pattern) for pattern in
+              [r'(?<=[.!?]) ', r', ', r'; ', r' but ', r' and ', r' as ', r' due to ']]
+
 # 2. Improve enhance_title to remove redundant company mentions
 def enhance_title(title, max_length=75):
     """
@@ -398,38 +601,20 @@ def enhance_title(title, max_length=75):
     original_title = title
     
     # Step 1: Remove stock ticker patterns: (NASDAQ:NVDA), (NYSE:AAPL), etc.
-    title = re.sub(r'\s*\([A-Z]+:[A-Z]+\)', '', title)
+    title = _TICKER_RE.sub('', title)
     
     # Step 2: Remove redundant prefixes
-    redundant_prefixes = [
-        "BREAKING: ", "Breaking: ", "UPDATE: ", "Update: ", "EXCLUSIVE: ", "Exclusive: ",
-        "REPORT: ", "Report: ", "WATCH: ", "Watch: ", "JUST IN: ", "Just In: ",
-        "VIDEO: ", "Video: ", "ANALYSIS: ", "Analysis: ", "FEATURED: ", "Featured: ",
-        "ALERT: ", "Alert: ", "TRENDING: ", "Trending: "
-    ]
-    
-    for prefix in redundant_prefixes:
-        if title.startswith(prefix):
-            title = title[len(prefix):]
-            break
+    title = _PREFIX_RE.sub('', title, count=1)
     
     # Step 3: Clean up trailing ellipses and other punctuation
-    title = re.sub(r'\.{3,}$', '', title.strip())
-    title = re.sub(r'\s*\.\.\.$', '', title)
+    title = _TRAILING_DOTS_RE.sub('', title.strip())
+    title = _TRAILING_ELLIPSIS_RE.sub('', title)
     
     # Step 4: Strip excess whitespace
     title = ' '.join(title.split())
     
     # Step 5: Remove specific phrases that add little value
-    filler_phrases = [
-        " according to sources", " according to reports", " according to insiders",
-        " sources say", " reports indicate", " experts say", " analysts believe",
-        ", experts say", ", analysts say", ", sources say", ", reports indicate",
-        " - report", " - sources", " - analysts", " - insiders", " report claims",
-        " analysts report", " sources claim", ", report says", ", report claims"
-    ]
-    
-    for phrase in filler_phrases:
+    for phrase in FILLER_PHRASES:
         if phrase in title.lower():
             title = title.replace(phrase, "")
             title = title.replace(phrase.capitalize(), "")
@@ -439,22 +624,17 @@ def enhance_title(title, max_length=75):
         title = title[0].upper() + title[1:]
     
     # NEW - Check for and remove redundant company mentions
-    # Extract common company names that might appear redundantly
-    common_companies = ["Amazon", "Amazon.com", "Apple", "Microsoft", "Google", "Meta", 
-                        "Facebook", "Tesla", "Nvidia", "Broadcom", "Alphabet"]
-    
-    for company in common_companies:
+    for company_lower, company_end_re, company_mention_re in _COMPANY_RES:
         # Check if company appears at start AND end of title
-        company_lower = company.lower()
         title_lower = title.lower()
         
         # If company is at beginning AND end (allowing for some words in between at the end)
         if title_lower.startswith(company_lower) and (
                 title_lower.endswith(company_lower) or 
-                re.search(rf'{company_lower}(\s+\w+){{1,3}}$', title_lower)):
+                company_end_re.search(title_lower)):
             
             # Remove from end (with the last few words if they exist)
-            end_match = re.search(rf'(,?\s+|-\s+)({company_lower}(\s+\w+){{0,3}})$', title_lower)
+            end_match = company_mention_re.search(title_lower)
             if end_match:
                 end_start = end_match.start()
                 title = title[:end_start]
@@ -464,7 +644,7 @@ def enhance_title(title, max_length=75):
                     title = title + '.'
                     
                 # Cleanup any trailing commas, dashes, or spaces
-                title = re.sub(r'[,\s-]+\.$', '.', title)
+                title = _DANGLING_END_RE.sub('.', title)
     
     # If title is now concise enough, return it
     if len(title) <= max_length:
@@ -511,8 +691,8 @@ def enhance_title(title, max_length=75):
             
             # Look for natural break points
             break_points = []
-            for pattern in [r'(?<=[.!?]) ', r', ', r'; ', r' but ', r' and ', r' as ', r' due to ']:
-                for match in re.finditer(pattern, shortened):
+            for break_re in _BREAK_RES:
+                for match in break_re.finditer(shortened):
                     break_points.append(match.end())
             
             if break_points:
@@ -568,41 +748,68 @@ def summarize_text(text, company_name=None, title_text=""):
     if not text or len(text) < 20:
         return "No article content available to summarize."
     
+    # Reuse the summary if this article was summarized recently
+    key = _summary_key(text, company_name, title_text)
+    summary = _cached_summary(key)
+    if summary is not None:
+        return summary
+    
     # Clean the article text
     text = clean_article_text(text)
     
-    # Extract title words for comparison later
-    title_words = set(re.findall(r'\b\w+\b', title_text.lower())) if title_text else set()
-    
     # First try with transformers if available (most sophisticated)
-    if TRANSFORMERS_AVAILABLE:
+    transformer_summary = None
+    if TRANSFORMERS_AVAILABLE and len(text.split()) >= MIN_TRANSFORMER_WORDS:
         transformer_summary = summarize_with_transformers(text, company_name, title_text)
-        if transformer_summary:
-            # Extra check to ensure transformer summary differs from title
-            summary_words = set(re.findall(r'\b\w+\b', transformer_summary.lower()))
-            # Calculate word overlap
-            if title_words:
-                overlap = len(summary_words.intersection(title_words)) / max(len(title_words), 1)
-                if overlap < 0.7:  # Less than 70% overlap is acceptable
-                    return transformer_summary
-            else:
+    
+    summary = _summarize_cleaned_text(text, title_text, transformer_summary)
+    _store_summary(key, summary)
+    return summary
+
+def _summarize_cleaned_text(text, title_text, transformer_summary=None):
+    """
+    Summarize already cleaned article text.
+    Uses transformer_summary when it differs enough from the title, and the
+    extractive approach otherwise.
+    
+    Args:
+        text (str): The cleaned article text
+        title_text (str): The title text to avoid redundancy
+        transformer_summary (str, optional): Summary generated by the model
+    
+    Returns:
+        str: An insightful summary
+    """
+    # Extract title words for comparison later
+    title_lower = title_text.lower() if title_text else ""
+    title_words = set(_WORD_RE.findall(title_lower))
+    
+    if transformer_summary:
+        # Extra check to ensure transformer summary differs from title
+        summary_words = set(_WORD_RE.findall(transformer_summary.lower()))
+        # Calculate word overlap
+        if title_words:
+            overlap = len(summary_words.intersection(title_words)) / max(len(title_words), 1)
+            if overlap < 0.7:  # Less than 70% overlap is acceptable
                 return transformer_summary
+        else:
+            return transformer_summary
     
     # Otherwise, use extractive summarization approach
     try:
-        # Make sure NLTK resources are downloaded
-        ensure_nltk_resources()
-        
         # Extract keywords
         keywords = extract_keywords(text)
         
+        # Split into sentences once for every extraction pass below
+        sentences = split_sentences(text)
+        
         # Extract important sentences (passing title to avoid redundancy)
-        important_sentences = extract_important_sentences(text, keywords, title_text=title_text)
+        important_sentences = extract_important_sentences(text, keywords, title_text=title_text,
+                                                          sentences=sentences)
         
         # NEW: Ensure we don't start the summary with the title or a very similar sentence
         if important_sentences and title_text:
             first_sentence = important_sentences[0].lower()
-            title_lower = title_text.lower()
             
             # Check similarity between first sentence and title
             if first_sentence == title_lower or (
@@ -614,9 +821,11 @@ def summarize_text(text, company_name=None, title_text=""):
                 # If we only have one sentence, try to get more sentences
                 else:
                     # Try to extract different sentences
-                    more_sentences = extract_important_sentences(text, keywords, max_sentences=5, title_text=title_text)
+                    more_sentences = extract_important_sentences(text, keywords, max_sentences=5,
+                                                                 title_text=title_text, sentences=sentences)
                     for sentence in more_sentences:
-                        if sentence.lower() != title_lower and title_lower not in sentence.lower():
+                        sentence_lower = sentence.lower()
+                        if sentence_lower != title_lower and title_lower not in sentence_lower:
                             important_sentences = [sentence]
                             break
         
@@ -624,12 +833,13 @@ def summarize_text(text, company_name=None, title_text=""):
         summary = format_summary(important_sentences)
         
         # Final cleanup and quality check
-        summary = re.sub(r'\s+', ' ', summary).strip()
+        summary = _WS_RE.sub(' ', summary).strip()
         
         # If summary is too short or appears incomplete, try to expand it
         if len(summary) < 100 and len(text) > 500:
             # Try to extract more sentences
-            more_sentences = extract_important_sentences(text, keywords, max_sentences=6, title_text=title_text)
+            more_sentences = extract_important_sentences(text, keywords, max_sentences=6,
+                                                         title_text=title_text, sentences=sentences)
             summary = format_summary(more_sentences)
         
         # Final check for trailing ellipses (we want complete sentences)
@@ -654,18 +864,18 @@ def summarize_text(text, company_name=None, title_text=""):
         
         # NEW: Final check to ensure summary differs significantly from title
         if summary and title_text:
-            summary_words = set(re.findall(r'\b\w+\b', summary.lower()))
+            summary_words = set(_WORD_RE.findall(summary.lower()))
             if title_words:
                 overlap = len(summary_words.intersection(title_words)) / max(len(title_words), 1)
                 
                 # If overlap is too high (>70%), try to find different sentences
                 if overlap > 0.7 and len(text) > 200:
                     # Get more diverse sentences by excluding first few sentences
-                    sentences = sent_tokenize(text)
                     if len(sentences) > 5:
                         alt_text = ' '.join(sentences[2:])  # Skip first two sentences
                         alt_keywords = extract_keywords(alt_text)
-                        alt_sentences = extract_important_sentences(alt_text, alt_keywords, max_sentences=4)
+                        alt_sentences = extract_important_sentences(alt_text, alt_keywords, max_sentences=4,
+                                                                    sentences=sentences[2:])
                         alt_summary = format_summary(alt_sentences)
                         
                         # Use alternative summary if it's substantial enough
@@ -691,4 +901,63 @@ def summarize_text(text, company_name=None, title_text=""):
         if paragraphs and len(paragraphs[0]) > 30:
             return paragraphs[0]
         
-        return text[:250].strip() + " [Truncated due to processing error]"
\ No newline at end of file
+        return text[:250].strip() + " [Truncated due to processing error]"
+
+
+def enhance_titles(titles, max_length=75):
+    """
+    Enhance a batch of article titles.
+
+    Args:
+        titles (list): The original article titles
+        max_length (int): Maximum target length for each enhanced title
+
+    Returns:
+        list: Enhanced titles, in the same order as titles
+    """
+    return [enhance_title(title, max_length) for title in titles]
+
+
+def summarize_texts(texts, company_names=None, title_texts=None):
+    """
+    Summarize a batch of article texts.
+    Batched entry point used by format_articles, so all articles of an
+    update go through the summarizer in a single call. With transformers
+    available, the model runs over all texts in batches rather than once
+    per article. Recently summarized articles are served from the cache.
+
+    Args:
+        texts (list): The article texts to summarize
+        company_names (list, optional): The company name for each text
+        title_texts (list, optional): The title for each text, to avoid redundancy
+
+    Returns:
+        list: Summaries, in the same order as texts
+    """
+    company_names = company_names or [None] * len(texts)
+    title_texts = title_texts or [""] * len(texts)
+    summaries = ["No article content available to summarize."] * len(texts)
+
+    # Clean substantial texts that aren't cached yet
+    keys = {}
+    cleaned = {}
+    for i, (text, company_name, title_text) in enumerate(zip(texts, company_names, title_texts)):
+        if not text or len(text) < 20:
+            continue
+        keys[i] = _summary_key(text, company_name, title_text)
+        summary = _cached_summary(keys[i])
+        if summary is not None:
+            summaries[i] = summary
+        else:
+            cleaned[i] = clean_article_text(text)
+
+    # Generate transformer summaries for the long enough texts in one batch
+    generated = {}
+    if TRANSFORMERS_AVAILABLE:
+        batch = [i for i, text in cleaned.items() if len(text.split()) >= MIN_TRANSFORMER_WORDS]
+        generated = dict(zip(batch, _transformer_summaries([cleaned[i] for i in batch])))
+
+    for i, text in cleaned.items():
+        summaries[i] = _summarize_cleaned_text(text, title_texts[i], generated.get(i))
+        _store_summary(keys[i], summaries[i])
+    return summaries
@@ -1,9 +1,16 @@
+import time
+import click
+import requests
 from flask import Flask
 from flask_cors import CORS
 from config.settings import Config
 from database.connect import init_db
+from api.cache import init_cache
 from api.routes import api_bp
 
+# Seconds between update status checks in the update-news command
+UPDATE_POLL_INTERVAL = 2
+
 def create_app():
     """
     Application factory function that creates and configures the Flask app.
@@ -19,6 +26,9 @@ def create_app():
     # Initialize database
     init_db(app)
 
+    # Initialize response cache
+    init_cache(app)
+
     # Register blueprints
     app.register_blueprint(api_bp, url_prefix='/api')
 
@@ -28,7 +38,29 @@ def create_app():
         return {
             "status": "healthy",
             "version": "1.0.0",
-            "endpoints": ["/api/news", "/api/news/update", "/api/news/api-usage"]
+            "endpoints": ["/api/news", "/api/news/update", "/api/news/update/status",
+                          "/api/news/api-usage"]
         }
 
+    @app.cli.command('update-news')
+    @click.option('--url', default=app.config['NEWS_API_URL'], show_default=True,
+                  help='Base URL of the running API server.')
+    def update_news_command(url):
+        """Have the running server fetch the latest news and save it."""
+        # The server owns the API usage counters and the response cache, so
+        # the update runs there rather than in this process
+        try:
+            response = requests.post(f'{url}/news/update', timeout=10)
+            response.raise_for_status()
+            status = response.json()
+            while status['status'] in ('accepted', 'running'):
+                time.sleep(UPDATE_POLL_INTERVAL)
+                status = requests.get(f'{url}/news/update/status', timeout=10).json()
+        except requests.RequestException as e:
+            raise click.ClickException(f"Could not reach the API server at {url}: {e}")
+
+        if status['status'] != 'success':
+            raise click.ClickException(status.get('message', 'News update failed'))
+        click.echo(status['message'])
+
     return app
\ No newline at end of file
@@ -5,4 +5,20 @@ load_dotenv()
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'fallback_secret')
-    DATABASE_URI = os.getenv('DATABASE_URI', 'sqlite:///stock_app.db')
\ No newline at end of file
+    DATABASE_URI = os.getenv('DATABASE_URI', 'sqlite:///stock_app.db')
+    # Server databases get a pool sized for threaded workers, with
+    # connections recycled hourly and checked before use so ones the server
+    # dropped while idle aren't handed out. SQLite file databases don't pool
+    SQLALCHEMY_ENGINE_OPTIONS = {} if DATABASE_URI.startswith('sqlite') else {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 30)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_recycle': 3600,
+        'pool_pre_ping': True,
+    }
+    # Response cache; use RedisCache for multi-worker deployments so all
+    # workers share cached responses and invalidation
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'SimpleCache')
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    # Running API server that the update-news CLI command asks to update
+    NEWS_API_URL = os.getenv('NEWS_API_URL', 'http://localhost:5000/api')
\ No newline at end of file
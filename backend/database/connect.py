@@ -1,11 +1,27 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from config.settings import Config
 
 db = SQLAlchemy()
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers don't block the writer, with one fsync per checkpoint."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 def init_db(app):
     app.config['SQLALCHEMY_DATABASE_URI'] = Config.DATABASE_URI
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     db.init_app(app)
     with app.app_context():
-        db.create_all()
\ No newline at end of file
+        if Config.DATABASE_URI.startswith('sqlite'):
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+        db.create_all()
+        # create_all skips tables that already exist, so add indexes
+        # declared later on existing databases too
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
\ No newline at end of file
@@ -2,6 +2,10 @@ from .connect import db
 
 class StockNews(db.Model):
     __tablename__ = 'stock_news'
+    # Serves "latest news for a symbol" from the index, in published order
+    __table_args__ = (
+        db.Index('ix_stock_news_symbol_published_at', 'symbol', 'published_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     symbol = db.Column(db.String(10))
     title = db.Column(db.String(255))
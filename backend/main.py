@@ -1,8 +1,7 @@
 from app import create_app
-from api.news_service import update_news
-
-updated_count = update_news()
 
+# News is fetched on the first /api/news request, or ahead of time with
+# `flask --app main update-news`, which asks the running server to update
 app = create_app()
 
 if __name__ == '__main__':